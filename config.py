@@ -6,7 +6,15 @@ e constantes utilizadas por toda a aplicação.
 """
 import sys
 import json
+import atexit
 from pathlib import Path
+from contextlib import contextmanager
+
+try:
+    # Parser/serializador JSON mais rápido, se disponível
+    import orjson
+except ImportError:
+    orjson = None
 
 # =========== Diretórios da aplicação ===========
 # Obtém o diretório de instalação
@@ -22,9 +30,11 @@ USER_DATA_DIR = Path.home() / ".local" / "share" / "ubuntu-dictation"
 LOG_DIR = USER_DATA_DIR / "logs"
 MODELS_DIR = USER_CACHE_DIR / "models"
 
-# Cria os diretórios necessários
-for directory in [USER_CONFIG_DIR, USER_CACHE_DIR, USER_DATA_DIR, LOG_DIR, MODELS_DIR]:
-    directory.mkdir(parents=True, exist_ok=True)
+# Cria os diretórios necessários. Os diretórios mais profundos implicam a
+# existência dos demais, então numa instalação existente basta um stat em cada.
+if not all(directory.is_dir() for directory in (USER_CONFIG_DIR, LOG_DIR, MODELS_DIR)):
+    for directory in [USER_CONFIG_DIR, USER_CACHE_DIR, USER_DATA_DIR, LOG_DIR, MODELS_DIR]:
+        directory.mkdir(parents=True, exist_ok=True)
 
 # =========== Arquivos de configuração ===========
 CONFIG_FILE = USER_CONFIG_DIR / "settings.json"
@@ -91,34 +101,157 @@ APP_WEBSITE = "https://github.com/usuario/ubuntu-dictation"
 APP_ICON_NAME = "microphone"  # Nome do ícone no tema
 
 
+# Cache das configurações carregadas e mtime (ns) do arquivo correspondente.
+# Só o formato plano fica em cache; o aninhado é montado a cada pedido, como
+# uma cópia que quem chamou pode alterar sem afetar o cache.
+_SETTINGS_FLAT = None
+_SETTINGS_MTIME = None
+
+# Alterações feitas por set_setting ainda não gravadas no arquivo
+_PENDING_WRITES = 0
+
+# Blocos batch_settings abertos (enquanto > 0, set_setting não grava o arquivo)
+_BATCH_DEPTH = 0
+
+# Marca a ausência de uma chave em get_setting
+_MISSING = object()
+
+
+def _flatten(settings, prefix=None):
+    """
+    Converte um dicionário aninhado para o formato plano com chaves pontuadas.
+    
+    Chaves que já estão no formato plano são mantidas, o que permite ler
+    tanto arquivos antigos (aninhados) quanto novos.
+    
+    Args:
+        settings (dict): Configurações a serem convertidas
+        prefix (str): Caminho a ser prefixado nas chaves, ou None
+    
+    Returns:
+        dict: Configurações no formato plano
+    """
+    flat = {}
+    stack = [(prefix, settings)]
+    while stack:
+        path, value = stack.pop()
+        # Dicionários vazios são mantidos como valor, para não sumirem
+        if type(value) is dict and (value or path is None):
+            # Empilha em ordem reversa para preservar a ordem original das chaves
+            for key, child in reversed(value.items()):
+                stack.append((key if path is None else f"{path}.{key}", child))
+        else:
+            flat[path] = value
+    return flat
+
+
+def _unflatten(flat):
+    """
+    Monta o dicionário aninhado a partir do formato plano.
+    
+    Args:
+        flat (dict): Configurações no formato plano
+    
+    Returns:
+        dict: Configurações no formato aninhado
+    """
+    nested = {}
+    for path, value in flat.items():
+        *parents, leaf = path.split('.')
+        current = nested
+        for part in parents:
+            child = current.get(part)
+            if type(child) is not dict:
+                child = current[part] = {}
+            current = child
+        current[leaf] = value
+    return nested
+
+
+# Configurações padrão no formato plano: "secao.chave" -> valor
+_DEFAULT_FLAT = _flatten(DEFAULT_SETTINGS)
+
+
 def load_settings():
     """
     Carrega as configurações do arquivo. Se o arquivo não existir,
     cria um novo com as configurações padrão.
     
+    O resultado fica em cache e só é relido quando o mtime do arquivo muda.
+    
     Returns:
-        dict: Configurações carregadas
+        dict: Configurações carregadas (formato aninhado, uma cópia nova a cada chamada)
     """
+    global _PENDING_WRITES
+    
     try:
-        if CONFIG_FILE.exists():
-            with open(CONFIG_FILE, 'r') as f:
-                user_settings = json.load(f)
-            
-            # Combina as configurações do usuário com os padrões
-            # para garantir que novas configurações sejam adicionadas
-            merged_settings = DEFAULT_SETTINGS.copy()
-            
-            # Atualiza de forma recursiva, preservando novas opções padrão
-            _update_nested_dict(merged_settings, user_settings)
-            
-            return merged_settings
-        else:
-            # Arquivo não existe, cria com configurações padrão
-            save_settings(DEFAULT_SETTINGS)
-            return DEFAULT_SETTINGS.copy()
+        try:
+            mtime = CONFIG_FILE.stat().st_mtime_ns
+        except FileNotFoundError:
+            # Arquivo não existe, cria com configurações padrão; se houver
+            # alterações pendentes, grava as configurações em memória (que as incluem)
+            pending = _SETTINGS_FLAT is not None and _PENDING_WRITES
+            flat = _SETTINGS_FLAT if pending else dict(_DEFAULT_FLAT)
+            mtime = None
+            if _write_settings(flat):
+                mtime = CONFIG_FILE.stat().st_mtime_ns
+                _PENDING_WRITES = 0
+            _cache_settings(flat, mtime)
+            return _nested_settings()
+        
+        # Arquivo inalterado desde a última leitura, ou com alterações em memória
+        # ainda não gravadas (que não podem ser descartadas)
+        if _SETTINGS_FLAT is not None and (mtime == _SETTINGS_MTIME or _PENDING_WRITES):
+            return _nested_settings()
+        
+        data = CONFIG_FILE.read_bytes()
+        user_settings = orjson.loads(data) if orjson else json.loads(data)
+        
+        # Combina as configurações do usuário com os padrões
+        # para garantir que novas configurações sejam adicionadas
+        _cache_settings({**_DEFAULT_FLAT, **_flatten(user_settings)}, mtime)
+        return _nested_settings()
     except Exception as e:
         print(f"Erro ao carregar configurações: {e}")
-        return DEFAULT_SETTINGS.copy()
+        # Sem mtime: a próxima chamada tenta ler o arquivo novamente
+        _cache_settings(dict(_DEFAULT_FLAT), None)
+        return _nested_settings()
+
+
+def _cache_settings(flat, mtime):
+    """
+    Guarda as configurações (formato plano) em cache.
+    
+    Args:
+        flat (dict): Configurações carregadas no formato plano
+        mtime (int): mtime (ns) do arquivo lido, ou None se não houver
+    """
+    global _SETTINGS_FLAT, _SETTINGS_MTIME
+    
+    _SETTINGS_FLAT = flat
+    _SETTINGS_MTIME = mtime
+
+
+def _nested_settings():
+    """
+    Monta a visão aninhada das configurações em cache.
+    
+    Returns:
+        dict: Cópia nova das configurações no formato aninhado
+    """
+    return _unflatten(_get_settings())
+
+
+def _get_settings():
+    """
+    Retorna as configurações no formato plano, lendo o arquivo apenas na primeira vez.
+    
+    Returns:
+        dict: Configurações em cache
+    """
+    if _SETTINGS_FLAT is None:
+        load_settings()
+    return _SETTINGS_FLAT
 
 
 def save_settings(settings):
@@ -126,14 +259,64 @@ def save_settings(settings):
     Salva as configurações no arquivo.
     
     Args:
-        settings (dict): Configurações a serem salvas
+        settings (dict): Configurações a serem salvas (aninhadas ou planas)
+    
+    Returns:
+        bool: True se as configurações foram salvas com sucesso
+    """
+    global _SETTINGS_FLAT, _PENDING_WRITES
+    
+    if not _write_settings(_flatten(settings)):
+        return False
+    
+    # Força a releitura na próxima consulta, já que o arquivo mudou por fora
+    # de set_setting (alterações pendentes foram substituídas)
+    _SETTINGS_FLAT = None
+    _PENDING_WRITES = 0
+    return True
+
+
+def flush_settings():
+    """
+    Grava no arquivo as alterações pendentes feitas por set_setting.
+    
+    Chamada automaticamente ao encerrar o programa.
+    
+    Returns:
+        bool: True se não havia pendências ou se foram salvas com sucesso
+    """
+    global _SETTINGS_MTIME, _PENDING_WRITES
+    
+    if not _PENDING_WRITES:
+        return True
+    if not _write_settings(_SETTINGS_FLAT):
+        return False
+    
+    # Evita reler o arquivo que acabamos de escrever
+    _SETTINGS_MTIME = CONFIG_FILE.stat().st_mtime_ns
+    _PENDING_WRITES = 0
+    return True
+
+
+atexit.register(flush_settings)
+
+
+def _write_settings(flat):
+    """
+    Grava as configurações (formato plano) no arquivo, sem mexer no cache.
+    
+    Args:
+        flat (dict): Configurações a serem salvas
     
     Returns:
         bool: True se as configurações foram salvas com sucesso
     """
     try:
-        with open(CONFIG_FILE, 'w') as f:
-            json.dump(settings, f, indent=4)
+        if orjson:
+            CONFIG_FILE.write_bytes(orjson.dumps(flat, option=orjson.OPT_INDENT_2))
+        else:
+            with open(CONFIG_FILE, 'w') as f:
+                json.dump(flat, f, indent=4)
         return True
     except Exception as e:
         print(f"Erro ao salvar configurações: {e}")
@@ -149,67 +332,78 @@ def get_setting(path, default=None):
         default: Valor padrão caso a configuração não exista
     
     Returns:
-        Valor da configuração ou valor padrão
+        Valor da configuração ou valor padrão. Para uma seção inteira
+        (ex: "speech_recognition"), retorna uma cópia em formato aninhado.
     """
-    settings = load_settings()
-    
-    # Divide o caminho em partes
-    parts = path.split('.')
-    
-    # Navega pelo dicionário
-    current = settings
-    for part in parts:
-        if part in current:
-            current = current[part]
-        else:
-            return default
+    flat = _get_settings()
+    value = flat.get(path, _MISSING)
+    if value is not _MISSING:
+        return value
     
-    return current
+    # Caminho para uma seção: monta o dicionário com as chaves dela
+    prefix = path + '.'
+    section = {key[len(prefix):]: value for key, value in flat.items() if key.startswith(prefix)}
+    return _unflatten(section) if section else default
 
 
 def set_setting(path, value):
     """
     Define uma configuração específica pelo caminho de acesso.
     
+    A alteração é gravada no arquivo imediatamente, exceto dentro de um bloco
+    batch_settings(), que grava todas as alterações juntas ao final.
+    
     Args:
         path (str): Caminho para a configuração (ex: "speech_recognition.language")
         value: Valor a ser definido
     
     Returns:
-        bool: True se a operação foi bem-sucedida
+        bool: True se a configuração foi gravada no arquivo (dentro de um
+        batch_settings(), True indica apenas que ela ficou pendente de gravação)
     """
-    settings = load_settings()
+    global _PENDING_WRITES
     
-    # Divide o caminho em partes
-    parts = path.split('.')
+    # Altera o cache diretamente
+    flat = _get_settings()
     
-    # Navega pelo dicionário até o penúltimo nível
-    current = settings
-    for part in parts[:-1]:
-        if part not in current:
-            current[part] = {}
-        current = current[part]
+    # Remove o valor anterior, inclusive as chaves de uma seção substituída
+    prefix = path + '.'
+    for key in [key for key in flat if key.startswith(prefix)]:
+        del flat[key]
+    flat.pop(path, None)
     
     # Define o valor
-    current[parts[-1]] = value
+    flat.update(_flatten({path: value}) if type(value) is dict else {path: value})
     
-    # Salva as configurações atualizadas
-    return save_settings(settings)
+    # Salva as configurações atualizadas, a menos que estejam sendo agrupadas
+    _PENDING_WRITES += 1
+    if _BATCH_DEPTH:
+        return True
+    return flush_settings()
 
 
-def _update_nested_dict(base_dict, new_dict):
+@contextmanager
+def batch_settings():
     """
-    Atualiza recursivamente um dicionário aninhado.
+    Agrupa várias chamadas a set_setting numa única gravação do arquivo.
     
-    Args:
-        base_dict (dict): Dicionário base a ser atualizado
-        new_dict (dict): Dicionário com novos valores
+    Útil, por exemplo, ao aplicar todas as opções de um diálogo de configurações:
+    
+        with config.batch_settings():
+            config.set("ui.theme", "dark")
+            config.set("ui.font_size", 14)
+    
+    As alterações são gravadas ao sair do bloco (mais externo, se aninhados).
     """
-    for key, value in new_dict.items():
-        if key in base_dict and isinstance(base_dict[key], dict) and isinstance(value, dict):
-            _update_nested_dict(base_dict[key], value)
-        else:
-            base_dict[key] = value
+    global _BATCH_DEPTH
+    
+    _BATCH_DEPTH += 1
+    try:
+        yield
+    finally:
+        _BATCH_DEPTH -= 1
+        if not _BATCH_DEPTH:
+            flush_settings()
 
 
 def reset_settings():
@@ -222,10 +416,16 @@ def reset_settings():
     return save_settings(DEFAULT_SETTINGS.copy())
 
 
-# Carrega as configurações quando o módulo é importado
-SETTINGS = load_settings()
+def __getattr__(name):
+    """Carrega SETTINGS sob demanda em vez de na importação do módulo."""
+    if name == "SETTINGS":
+        return _nested_settings()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
 
 # Para uso simplificado em outros módulos
 get = get_setting
 set = set_setting
-reset = reset_settings
\ No newline at end of file
+reset = reset_settings
+flush = flush_settings
+batch = batch_settings
\ No newline at end of file
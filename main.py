@@ -5,9 +5,6 @@ import argparse
 import logging
 from pathlib import Path
 import config  # Importa primeiro para garantir que as pastas foram criadas
-from services.logging_service import setup_logging, get_logger
-from services.enhanced_logging_service import logger as enhanced_logger
-from ui.app_window import DictationApp
 
 def parse_arguments():
     """
@@ -104,6 +101,10 @@ def main():
         list_audio_devices()
         return 0
     
+    # Importações adiadas: --version e --list-devices não precisam do logging
+    # nem da interface gráfica
+    from services.logging_service import setup_logging, get_logger
+    
     # Configurar o logging
     log_level = logging.DEBUG if args.debug else None
     setup_logging(level=log_level, use_enhanced=True)
@@ -111,42 +112,38 @@ def main():
     
     # Configurar modo debug no logger avançado
     if args.debug:
-        enhanced_logger.set_debug_mode(True)
+        from services.enhanced_logging_service import set_debug
+        set_debug(True)
     
-    # Log inicial
-    logger.info(f"Iniciando {config.APP_NAME} v{config.APP_VERSION}")
-    enhanced_logger.log_info("main", f"Iniciando {config.APP_NAME} v{config.APP_VERSION}", "system")
+    # Log inicial (o logger avançado recebe os mesmos registros como handler)
+    logger.info("Iniciando %s v%s", config.APP_NAME, config.APP_VERSION)
     
     try:
         # Verificar se estamos no ambiente gráfico
         if args.no_gui:
             logger.info("Iniciando em modo CLI (sem interface gráfica)")
-            enhanced_logger.log_info("main", "Iniciando em modo CLI (sem interface gráfica)", "system")
             # TODO: Implementar modo CLI para reconhecimento de voz
             print("Modo CLI ainda não implementado.")
             return 1
         else:
             # Verificar se o display X11/Wayland está disponível
             if not os.environ.get('DISPLAY') and not os.environ.get('WAYLAND_DISPLAY'):
-                logger.error("Nenhum servidor gráfico (X11/Wayland) detectado!")
-                enhanced_logger.log_critical("main", "Nenhum servidor gráfico (X11/Wayland) detectado!", "system")
+                logger.critical("Nenhum servidor gráfico (X11/Wayland) detectado!")
                 print("Erro: Esta aplicação requer um ambiente gráfico para funcionar.")
                 print("Se estiver em um servidor remoto, use SSH com encaminhamento X11.")
                 return 1
             
             # Iniciar a aplicação com interface gráfica
-            logger.info("Iniciando interface gráfica")
-            enhanced_logger.log_info("main", "Iniciando interface gráfica", "ui")
+            logger.info("Iniciando interface gráfica", extra={"process_type": "ui"})
+            from ui.app_window import DictationApp
             app = DictationApp()
             return app.run()
             
     except Exception as e:
-        logger.exception(f"Erro não tratado na aplicação: {e}")
-        enhanced_logger.log_critical("main", f"Erro não tratado na aplicação: {str(e)}", "system")
+        logger.critical("Erro não tratado na aplicação: %s", e, exc_info=True)
         return 1
     finally:
         logger.info("Aplicação encerrada")
-        enhanced_logger.log_info("main", "Aplicação encerrada", "system")
 
 
 if __name__ == "__main__":
@@ -3,22 +3,36 @@ Serviço de logging avançado para a aplicação Ubuntu Dictation.
 
 Este módulo implementa um sistema de logging com formatação tabular
 que escreve registros detalhados em arquivos de texto com alinhamento preciso.
+
+O EnhancedLogger é um handler do logging padrão do Python: uma vez instalado
+no logger raiz, qualquer chamada como logger.info(...) também gera a entrada
+tabular, usando os campos já presentes no LogRecord (função, arquivo, horário).
+Os campos extras "task", "process_type" e "status" podem ser passados via
+extra={...}.
 """
-import os
 import time
+import queue
+import atexit
 import logging
-import datetime
-import inspect
-import textwrap
+import threading
 from enum import Enum
-from pathlib import Path
+from collections import OrderedDict
 
 # Importa a configuração para obter os caminhos
-from config import USER_DATA_DIR, APP_NAME, APP_VERSION
+# (o diretório de logs já é criado pelo próprio config)
+from config import LOG_DIR, APP_NAME, APP_VERSION
+
+# Máximo de itens da fila gravados de uma só vez pela thread de escrita
+WRITE_BATCH_SIZE = 128
+
+# Janela (segundos) em que mensagens repetidas da mesma função são suprimidas
+REPEAT_WINDOW = 1.0
 
-# Diretório para armazenar logs
-LOG_DIR = USER_DATA_DIR / "logs"
-LOG_DIR.mkdir(parents=True, exist_ok=True)
+# Quantidade de mensagens distintas acompanhadas para detectar repetições
+REPEAT_CACHE_SIZE = 256
+
+# Troca caracteres de espaço especiais por espaço simples nas mensagens
+_WHITESPACE_TO_SPACE = str.maketrans("\t\n\r\x0b\x0c", "     ")
 
 class ProcessType(str, Enum):
     """Tipos de processos para categorização nos logs"""
@@ -37,10 +51,40 @@ class LogStatus(str, Enum):
     INFO = "information"
     DEBUG = "debug"
 
-class EnhancedLogger:
+# Tabelas de validação rápida. Como os enums herdam de str, a mesma chave
+# atende tanto ao membro (ProcessType.UI) quanto à string ("ui")
+_PROCESS_TYPE_VALUES = {pt.value: pt.value for pt in ProcessType}
+_LOG_STATUSES = {st.value: st for st in LogStatus}
+
+# Nível de logging do Python correspondente a cada status
+_STATUS_TO_LEVEL = {
+    LogStatus.CRITICAL: logging.CRITICAL,
+    LogStatus.FAILURE: logging.ERROR,
+    LogStatus.WARNING: logging.WARNING,
+    LogStatus.INFO: logging.INFO,
+    LogStatus.SUCCESS: logging.INFO,
+    LogStatus.DEBUG: logging.DEBUG
+}
+
+def _status_for_level(levelno):
+    """Status padrão para registros que não informam um status explícito"""
+    if levelno >= logging.CRITICAL:
+        return LogStatus.CRITICAL
+    if levelno >= logging.ERROR:
+        return LogStatus.FAILURE
+    if levelno >= logging.WARNING:
+        return LogStatus.WARNING
+    if levelno >= logging.INFO:
+        return LogStatus.INFO
+    return LogStatus.DEBUG
+
+class EnhancedLogger(logging.Handler):
     """
     Logger avançado com formatação tabular e alinhamento preciso.
     Grava logs em arquivos com formato de tabela alinhada.
+    
+    Funciona como um logging.Handler instalado no logger raiz, de modo que
+    cada evento passa por um único pipeline de logging.
     """
     
     def __init__(self, project_name=APP_NAME):
@@ -50,9 +94,17 @@ class EnhancedLogger:
         Args:
             project_name: Nome do projeto/aplicação para os arquivos de log
         """
+        super().__init__()
         self.project_name = project_name
+        self._logger = logging.getLogger(project_name)
         self.log_dir = LOG_DIR
         self.log_file = None
+        self._fh = None
+        self._queue = None
+        self._writer = None
+        # Janelas de repetição abertas, na ordem em que foram abertas:
+        # (função, mensagem, status) -> [início da janela, repetições suprimidas, último registro]
+        self._recent = OrderedDict()
         self.debug_mode = True  # Valor padrão
         
         # Formato de colunas - definições de largura
@@ -72,22 +124,36 @@ class EnhancedLogger:
         # Quantidade de espaço entre borda e conteúdo da coluna
         self.padding = 1
         
+        # Linhas e formatos pré-calculados, já que as larguras não mudam
+        pad = " " * self.padding
+        self._separator_line = "+" + "+".join(
+            "-" * (width + self.padding * 2) for width in self.col_widths.values()
+        ) + "+"
+        self._col_fmts = [f"{pad}{{:<{width}}}{pad}" for width in self.col_widths.values()]
+        self._row_fmt = "|" + "|".join(self._col_fmts) + "|\n"
+        # Linha de continuação: apenas a coluna de mensagem tem conteúdo
+        self._cont_fmt = "|" + "|".join(
+            f"{pad}{{0:<{width}}}{pad}" if name == 'message' else " " * (width + self.padding * 2)
+            for name, width in self.col_widths.items()
+        ) + "|\n"
+        
         # Setup inicial
         self.setup_logging()
         
     def setup_logging(self):
         """Configuração inicial do logging"""
-        # Criar pasta de logs se não existir
-        os.makedirs(self.log_dir, exist_ok=True)
-        
-        # Criar arquivo de log com timestamp
-        timestamp = datetime.datetime.now().strftime('%Y%m%d_%H%M%S')
-        self.log_file = os.path.join(self.log_dir, f"{self.project_name}_{timestamp}.log")
+        # Um arquivo por dia, compartilhado pelas execuções do mesmo dia. Ele só é
+        # criado (com cabeçalho, se novo) quando a primeira entrada for gravada
+        day = time.strftime('%Y%m%d')
+        self.log_file = self.log_dir / f"{self.project_name}_{day}.log"
         
-        # Define codificação UTF-8 para o arquivo de log
-        with open(self.log_file, 'w', encoding='utf-8') as f:
-            # Escreve o cabeçalho do arquivo de log
-            f.write(self._create_header())
+        # As entradas são enfileiradas e gravadas em lote por uma thread dedicada,
+        # para que quem registra o log não espere pelo disco
+        self._queue = queue.SimpleQueue()
+        self._writer = threading.Thread(
+            target=self._write_loop, name="EnhancedLoggerWriter", daemon=True
+        )
+        self._writer.start()
         
         # Configurar logging padrão do Python
         logging.basicConfig(
@@ -98,20 +164,18 @@ class EnhancedLogger:
             ]
         )
         
+        # Recebe os registros de todos os loggers da aplicação
+        logging.getLogger().addHandler(self)
+        
         # Registra função para adicionar linha de fechamento ao encerrar programa
-        import atexit
         atexit.register(self._add_closing_line)
         
         # Log inicial
         self.log_info("setup_logging", f"Iniciado logger para {self.project_name} v{APP_VERSION}")
         
     def _create_separator_line(self):
-        """Cria a linha separadora com + alinhado precisamente com as barras verticais"""
-        separator = "+"
-        for name, width in self.col_widths.items():
-            # Adiciona dois traços extras para compensar o espaço de padding em cada lado
-            separator += "-" * (width + self.padding * 2) + "+"
-        return separator
+        """Retorna a linha separadora com + alinhado precisamente com as barras verticais"""
+        return self._separator_line
         
     def _create_header(self):
         """Cria o cabeçalho com alinhamento preciso e títulos melhor centralizados"""
@@ -142,141 +206,295 @@ class EnhancedLogger:
         full_header = separator + "\n" + header_line + "\n" + separator + "\n"
         return full_header
 
-    def _get_caller_info(self, depth=3):
-        """Obtém informações sobre o chamador (arquivo, função)
+    @staticmethod
+    def _coerce_process_type(process_type):
+        """Converte um valor qualquer em ProcessType (SYSTEM se inválido)"""
+        try:
+            return ProcessType(process_type.lower())
+        except (ValueError, AttributeError):
+            return ProcessType.SYSTEM
+    
+    @staticmethod
+    def _coerce_status(status):
+        """Converte um valor qualquer em LogStatus (INFO se inválido)"""
+        try:
+            return LogStatus(status.lower())
+        except (ValueError, AttributeError):
+            return LogStatus.INFO
         
-        Args:
-            depth (int): Quão longe na pilha de chamadas olhar para o chamador
-                    2 = chamador direto deste método
-                    3 = chamador do método de logging (padrão)
-                    4 ou mais = mais longe na pilha de chamadas
+    def log_entry(self, function_name, log_message, process_type=ProcessType.SYSTEM, status=LogStatus.INFO, task_name=None):
+        """Registra uma nova entrada pelo logging padrão (console, arquivos e tabela)"""
+        status = _LOG_STATUSES.get(status) or self._coerce_status(status)
+        level = _STATUS_TO_LEVEL.get(status, logging.INFO)
         
-        Returns:
-            tuple: (nome_arquivo, nome_função)
-        """
+        logger = self._logger if task_name is None else logging.getLogger(task_name)
+        if not logger.isEnabledFor(level):
+            return
+        
+        # stacklevel=3 aponta para quem chamou log_info/log_error/etc.
+        logger.log(
+            level, log_message, stacklevel=3,
+            extra={
+                'function_name': function_name,
+                'process_type': process_type,
+                'status': status,
+                'task': task_name
+            }
+        )
+    
+    def emit(self, record):
+        """Formata o registro como linha(s) da tabela e o enfileira para gravação"""
         try:
-            # Pega a stack de chamadas até o depth desejado
-            frame = inspect.currentframe()
-            for _ in range(depth):
-                if frame.f_back is None:
-                    break
-                frame = frame.f_back
+            q = self._queue
+            if q is None:
+                return
             
-            # Extrai informações do frame
-            if frame:
-                frame_info = inspect.getframeinfo(frame)
-                filename = os.path.basename(frame_info.filename)
-                function_name = frame_info.function
-                return filename, function_name
+            function_name = record.__dict__.get('function_name') or record.funcName
+            log_message = record.getMessage()
+            status = self._record_status(record)
+            
+            # Avisos e erros nunca são suprimidos
+            if record.levelno < logging.WARNING:
+                log_message = self._throttle(record, function_name, log_message, status)
+                if log_message is None:
+                    return
+            
+            # Enfileira para a thread de escrita
+            q.put(self._format_entry(record, function_name, log_message, status))
+            
+            # Garante que erros críticos cheguem ao disco mesmo se o processo cair em seguida
+            if status is LogStatus.CRITICAL:
+                self.flush()
         except Exception:
-            pass
+            self.handleError(record)
+    
+    def _record_status(self, record):
+        """Obtém o status do registro (explícito via extra ou derivado do nível)"""
+        status = record.__dict__.get('status')
+        if status is None:
+            return _status_for_level(record.levelno)
+        return _LOG_STATUSES.get(status) or self._coerce_status(status)
+    
+    def _throttle(self, record, function_name, log_message, status):
+        """
+        Suprime repetições da mesma mensagem dentro de REPEAT_WINDOW.
         
-        return "unknown.py", "unknown"
+        A primeira ocorrência é registrada normalmente; as repetições dentro da
+        janela são apenas contadas e, quando a janela fecha, saem numa única
+        linha com o sufixo "(×N)", onde N é a quantidade suprimida.
         
-    def log_entry(self, function_name, log_message, process_type=ProcessType.SYSTEM, status=LogStatus.INFO, task_name=None):
-        """Registra uma nova entrada no arquivo de log com alinhamento preciso"""
-        # Obtém data e hora atuais
-        now = datetime.datetime.now()
-        timestamp = now.strftime('%Y-%m-%d %H:%M:%S')
+        Returns:
+            str: Mensagem a registrar, ou None se ela deve ser suprimida
+        """
+        q = self._queue
+        for row in self._expire_repeats(record.created):
+            q.put(row)
         
-        # Usa o nome da aplicação como tarefa se não for fornecido
-        if task_name is None:
-            task_name = self.project_name
+        key = (function_name, log_message, status)
+        recent = self._recent
+        entry = recent.get(key)
         
-        # Obtém informações do chamador (arquivo)
-        source_file, _ = self._get_caller_info(depth=3)
+        # Depois de _expire_repeats, toda janela restante ainda está aberta
+        if entry is not None:
+            entry[1] += 1
+            entry[2] = record
+            return None
         
-        # Valida valores de enum
-        if not isinstance(process_type, ProcessType):
-            try:
-                process_type = ProcessType(process_type.lower())
-            except ValueError:
-                process_type = ProcessType.SYSTEM
-                
-        if not isinstance(status, LogStatus):
-            try:
-                status = LogStatus(status.lower())
-            except ValueError:
-                status = LogStatus.INFO
+        recent[key] = [record.created, 0, record]
+        if len(recent) > REPEAT_CACHE_SIZE:
+            # Não perde a contagem de repetições da mensagem descartada
+            old_key, old_entry = recent.popitem(last=False)
+            if old_entry[1]:
+                q.put(self._repeat_summary(old_key, old_entry))
+        return log_message
+    
+    def _expire_repeats(self, now):
+        """Fecha as janelas de repetição vencidas, retornando as linhas "(×N)" a gravar"""
+        # As janelas estão em ordem de abertura: basta olhar o início do dicionário
+        recent = self._recent
+        rows = []
+        while recent:
+            key = next(iter(recent))
+            entry = recent[key]
+            if now - entry[0] < REPEAT_WINDOW:
+                break
+            del recent[key]
+            if entry[1]:
+                rows.append(self._repeat_summary(key, entry))
+        return rows
+    
+    def _repeat_summary(self, key, entry):
+        """Monta a linha "(×N)" de uma janela de repetição, com o horário da última repetição"""
+        function_name, log_message, status = key
+        _, count, record = entry
+        return self._format_entry(record, function_name, f"{log_message} (×{count})", status)
+    
+    def _format_entry(self, record, function_name, log_message, status):
+        """Monta as linhas da tabela para um registro"""
+        attrs = record.__dict__
+        
+        # Horário de criação do registro (sem alocar um objeto datetime)
+        timestamp = time.strftime('%Y-%m-%d %H:%M:%S', time.localtime(record.created))
+        
+        # Usa o nome da aplicação como tarefa se não for fornecido
+        task_name = attrs.get('task') or self.project_name
+        
+        # Valida valores de enum (conversão completa só para valores fora do padrão)
+        process_type = attrs.get('process_type', ProcessType.SYSTEM)
+        ptype_str = _PROCESS_TYPE_VALUES.get(process_type)
+        if ptype_str is None:
+            ptype_str = self._coerce_process_type(process_type).value
         
         # Formato do status
         status_str = status.value
         
-        # Quebra a mensagem em múltiplas linhas se necessário
-        message_lines = textwrap.wrap(log_message, width=self.message_width)
-        if not message_lines:
-            message_lines = [""]
-            
-        # Prepara valores para cada coluna (truncando se necessário)
-        values = {
-            'timestamp': timestamp[:self.col_widths['timestamp']],
-            'task': task_name[:self.col_widths['task']],
-            'function': function_name[:self.col_widths['function']],
-            'file': source_file[:self.col_widths['file']],
-            'message': message_lines[0],
-            'process_type': process_type.value[:self.col_widths['process_type']],
-            'status': status_str[:self.col_widths['status']]
-        }
+        # Quebras de linha e tabulações desalinhariam a tabela
+        if not log_message.isprintable():
+            log_message = log_message.translate(_WHITESPACE_TO_SPACE)
         
-        # Formata a linha usando o mesmo padrão de padding que o cabeçalho
-        log_line = "|"
-        for name, width in self.col_widths.items():
-            content = values[name]
-            padding_right = width - len(content) + self.padding
-            log_line += " " * self.padding + content + " " * padding_right + "|"
+        # Quebra a mensagem em fatias da largura da coluna se necessário
+        w = self.message_width
+        message_lines = [log_message[i:i + w] for i in range(0, len(log_message), w)] or [""]
             
-        # Escreve no arquivo de log com codificação UTF-8
-        with open(self.log_file, 'a', encoding='utf-8') as f:
-            f.write(log_line + "\n")
-            
-            # Se houver mais linhas na mensagem, adiciona-as com alinhamento preciso
-            if len(message_lines) > 1:
-                # Cria linha de continuação para cada linha adicional da mensagem
-                for i in range(1, len(message_lines)):
-                    cont_line = "|"
-                    for name, width in self.col_widths.items():
-                        if name == 'message':
-                            # A coluna de mensagem tem conteúdo
-                            content = message_lines[i]
-                            padding_right = width - len(content) + self.padding
-                            cont_line += " " * self.padding + content + " " * padding_right + "|"
-                        else:
-                            # Outras colunas ficam vazias
-                            cont_line += " " * (width + self.padding * 2) + "|"
-                    f.write(cont_line + "\n")
+        # Formata a linha usando o mesmo padrão de padding que o cabeçalho
+        # (truncando os valores se necessário)
+        widths = self.col_widths
+        log_line = self._row_fmt.format(
+            timestamp[:widths['timestamp']],
+            task_name[:widths['task']],
+            function_name[:widths['function']],
+            record.filename[:widths['file']],
+            message_lines[0],
+            ptype_str[:widths['process_type']],
+            status_str[:widths['status']]
+        )
             
-            # Adiciona separador após erros críticos para ênfase
-            if status == LogStatus.CRITICAL:
-                f.write(self._create_separator_line() + "\n")
+        # Se houver mais linhas na mensagem, adiciona-as com alinhamento preciso
+        if len(message_lines) > 1:
+            log_line += "".join(self._cont_fmt.format(line) for line in message_lines[1:])
         
-        # Log para console
-        log_level = self._get_log_level(status)
-        logging.log(log_level, f"{task_name} - {function_name}: {log_message}")
+        # Adiciona separador após erros críticos para ênfase
+        if status is LogStatus.CRITICAL:
+            log_line += self._separator_line + "\n"
+        
+        return log_line
     
-    def _add_closing_line(self):
-        """Adiciona linha de fechamento ao arquivo de log quando o programa encerra"""
-        if hasattr(self, 'log_file') and self.log_file and os.path.exists(self.log_file):
+    def _open_log_file(self):
+        """Abre o arquivo de log para acréscimo, escrevendo o cabeçalho se ele for novo"""
+        f = open(self.log_file, 'a', encoding='utf-8', buffering=8192)
+        if f.tell() == 0:
+            f.write(self._create_header())
+        self._fh = f
+        return f
+    
+    def _write_pending(self, f, pending, flush=False):
+        """Grava as entradas pendentes, abrindo o arquivo na primeira vez"""
+        try:
+            if pending:
+                if f is None:
+                    f = self._open_log_file()
+                f.write("".join(pending))
+            if flush and f is not None:
+                f.flush()
+        except Exception:
+            pass  # Falha silenciosamente se não puder escrever no arquivo
+        pending.clear()
+        return f
+    
+    def _write_loop(self):
+        """Grava no arquivo, em lotes, as entradas enfileiradas por emit"""
+        q = self._queue
+        f = None
+        while True:
+            # Bloqueia até chegar algo e aproveita o que mais já estiver na fila.
+            # Com janelas de repetição abertas, acorda ao fim da janela para
+            # gravar o "(×N)" mesmo que nenhum outro registro chegue
+            try:
+                batch = [q.get(timeout=REPEAT_WINDOW if self._recent else None)]
+            except queue.Empty:
+                # Se o lock estiver ocupado, emit está em andamento e fecha as janelas
+                if self.lock.acquire(blocking=False):
+                    try:
+                        rows = self._expire_repeats(time.time())
+                    finally:
+                        self.lock.release()
+                    if rows:
+                        f = self._write_pending(f, rows)
+                continue
             try:
-                with open(self.log_file, 'a', encoding='utf-8') as f:
+                while len(batch) < WRITE_BATCH_SIZE:
+                    batch.append(q.get_nowait())
+            except queue.Empty:
+                pass
+            
+            pending = []
+            for item in batch:
+                if item.__class__ is str:
+                    pending.append(item)
+                    continue
+                
+                # Item de controle: encerramento (None) ou pedido de flush (Event)
+                if item is None and (f is not None or pending):
                     # Adiciona linha com data/hora de encerramento
-                    now = datetime.datetime.now().strftime('%Y-%m-%d %H:%M:%S')
-                    f.write(self._create_separator_line() + "\n")
-                    f.write(f"| Log encerrado em: {now}" + " " * 150 + "|\n")
-                    f.write(self._create_separator_line() + "\n")
-            except Exception:
-                pass  # Falha silenciosamente se não puder escrever no arquivo
+                    now = time.strftime('%Y-%m-%d %H:%M:%S')
+                    pending.append(
+                        self._separator_line + "\n"
+                        + f"| Log encerrado em: {now}" + " " * 150 + "|\n"
+                        + self._separator_line + "\n"
+                    )
+                
+                # Grava o que estiver pendente e descarrega o arquivo
+                f = self._write_pending(f, pending, flush=True)
+                
+                if item is None:
+                    if f is not None:
+                        try:
+                            f.close()
+                        except Exception:
+                            pass
+                    return  # Pedido de encerramento
+                item.set()  # Pedido de flush atendido
+            
+            if pending:
+                f = self._write_pending(f, pending)
+    
+    def flush(self, timeout=1.0):
+        """Aguarda a gravação em disco das entradas já enfileiradas"""
+        q = self._queue
+        if q is None or not self._writer.is_alive():
+            return
+        done = threading.Event()
+        q.put(done)
+        done.wait(timeout)
+    
+    def _add_closing_line(self):
+        """Adiciona linha de fechamento ao arquivo de log e o fecha quando o programa encerra"""
+        with self.lock:
+            q = self._queue
+            if q is None:
+                return
+            
+            # Registra as repetições ainda não contabilizadas
+            for key, entry in self._recent.items():
+                if entry[1]:
+                    q.put(self._repeat_summary(key, entry))
+            self._recent.clear()
+            self._queue = None
+        
+        # A thread de escrita grava a linha de fechamento (se o arquivo chegou a
+        # ser criado) e fecha o arquivo
+        q.put(None)
+        self._writer.join(timeout=2.0)
+    
+    def close(self):
+        """Remove o handler do logger raiz e fecha o arquivo de log"""
+        logging.getLogger().removeHandler(self)
+        self._add_closing_line()
+        super().close()
                 
     def _get_log_level(self, status):
         """Mapeia status de log para nível de logging do Python"""
-        status_map = {
-            LogStatus.CRITICAL: logging.CRITICAL,
-            LogStatus.FAILURE: logging.ERROR,
-            LogStatus.WARNING: logging.WARNING,
-            LogStatus.INFO: logging.INFO,
-            LogStatus.SUCCESS: logging.INFO,
-            LogStatus.DEBUG: logging.DEBUG
-        }
-        return status_map.get(status, logging.INFO)
+        return _STATUS_TO_LEVEL.get(status, logging.INFO)
     
     def log_info(self, function_name, message, process_type=ProcessType.SYSTEM):
         """Registra mensagem informativa"""
@@ -303,55 +521,89 @@ class EnhancedLogger:
         """Registra mensagem de erro crítico"""
         self.log_entry(function_name, message, process_type, LogStatus.CRITICAL)
     
+    def _noop(self, *args, **kwargs):
+        """Substitui log_debug enquanto o modo de depuração está desativado"""
+    
+    def is_debug(self):
+        """Indica se o modo de depuração está ativo"""
+        return self.debug_mode
+    
     def set_debug_mode(self, enabled=True):
         """Ativa ou desativa o modo de depuração"""
         self.debug_mode = enabled
+        # Com a depuração desativada, log_debug vira um no-op na própria instância,
+        # evitando qualquer trabalho (nem a chamada a log_entry) nos pontos de debug
+        if enabled:
+            self.__dict__.pop('log_debug', None)
+        else:
+            self.log_debug = self._noop
         # Atualiza o nível de logging
         logging.getLogger().setLevel(logging.DEBUG if enabled else logging.INFO)
         self.log_info("set_debug_mode", f"Modo de depuração {'ativado' if enabled else 'desativado'}")
 
 
-# Instância global para uso em toda a aplicação
-logger = EnhancedLogger()
+# Instância global para uso em toda a aplicação, criada apenas no primeiro uso
+# (criá-la abre o arquivo de log, o que não deve acontecer só por importar o módulo)
+_logger = None
+
+def _get_logger():
+    """Retorna o logger global, criando-o se necessário"""
+    global _logger
+    if _logger is None:
+        _logger = EnhancedLogger()
+    return _logger
+
+def __getattr__(name):
+    """Mantém o acesso a `logger` como atributo do módulo, criado sob demanda"""
+    if name == "logger":
+        return _get_logger()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 # Funções de conveniência para chamar os métodos do logger global
 def setup(project_name=APP_NAME):
     """Configura o logger com um nome de projeto específico"""
-    global logger
-    logger = EnhancedLogger(project_name)
-    return logger
+    global _logger
+    # Substitui a instância anterior, que senão continuaria recebendo os registros
+    if _logger is not None:
+        _logger.close()
+    _logger = EnhancedLogger(project_name)
+    return _logger
 
 def info(function_name, message, process_type=ProcessType.SYSTEM):
     """Registra mensagem informativa"""
-    logger.log_info(function_name, message, process_type)
+    _get_logger().log_info(function_name, message, process_type)
 
 def debug(function_name, message, process_type=ProcessType.SYSTEM):
     """Registra mensagem de depuração"""
-    logger.log_debug(function_name, message, process_type)
+    _get_logger().log_debug(function_name, message, process_type)
 
 def success(function_name, message, process_type=ProcessType.SYSTEM):
     """Registra mensagem de sucesso"""
-    logger.log_success(function_name, message, process_type)
+    _get_logger().log_success(function_name, message, process_type)
 
 def warning(function_name, message, process_type=ProcessType.SYSTEM):
     """Registra mensagem de aviso"""
-    logger.log_warning(function_name, message, process_type)
+    _get_logger().log_warning(function_name, message, process_type)
 
 def error(function_name, message, process_type=ProcessType.SYSTEM):
     """Registra mensagem de erro"""
-    logger.log_error(function_name, message, process_type)
+    _get_logger().log_error(function_name, message, process_type)
 
 def critical(function_name, message, process_type=ProcessType.SYSTEM):
     """Registra mensagem de erro crítico"""
-    logger.log_critical(function_name, message, process_type)
+    _get_logger().log_critical(function_name, message, process_type)
 
 def set_debug(enabled=True):
     """Ativa ou desativa o modo de depuração"""
-    logger.set_debug_mode(enabled)
+    _get_logger().set_debug_mode(enabled)
+
+def is_debug():
+    """Indica se o modo de depuração está ativo (útil para evitar montar mensagens de debug)"""
+    return _get_logger().is_debug()
 
 def get_log_file():
     """Retorna o caminho do arquivo de log atual"""
-    return logger.log_file
+    return _get_logger().log_file
 
 # Teste do módulo
 if __name__ == "__main__":
@@ -10,10 +10,17 @@ O módulo permite escolher qual sistema usar ou usar ambos simultaneamente.
 """
 import os
 import sys
+import time
+import queue
+import codecs
+import atexit
+import signal
 import logging
-from logging.handlers import RotatingFileHandler
+import threading
+import importlib.util
+from logging.handlers import RotatingFileHandler, QueueHandler, QueueListener
+from collections import deque
 from pathlib import Path
-from datetime import datetime
 
 # Importações do projeto
 from config import USER_DATA_DIR, APP_NAME, APP_VERSION
@@ -23,16 +30,264 @@ LOG_DIR = USER_DATA_DIR / "logs"
 DEFAULT_LOG_LEVEL = logging.INFO
 MAX_LOG_SIZE = 5 * 1024 * 1024  # 5 MB
 BACKUP_COUNT = 3  # Manter 3 arquivos de backup
+FILE_BUFFER_SIZE = 64 * 1024  # Buffer de escrita do arquivo de log
+FLUSH_INTERVAL = 30  # Segundos entre descargas periódicas do buffer
 
-# Garantir que o diretório de logs exista
-LOG_DIR.mkdir(parents=True, exist_ok=True)
+# Se o diretório de logs já foi criado (só é necessário para o log em arquivo)
+_log_dir_ready = False
 
-# Nome do arquivo de log baseado na data
-LOG_FILE = LOG_DIR / f"ubuntu-dictation-{datetime.now().strftime('%Y-%m-%d')}.log"
+# Formato dos registros de log padrão
+LOG_FORMAT = '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+LOG_DATEFMT = '%Y-%m-%d %H:%M:%S'
+
+# Cache de list_log_files, invalidado pelo mtime de LOG_DIR
+_log_list_cache = None
+_log_list_mtime = -1
 
 # Referência para o logger avançado
 enhanced_logger = None
 
+# Nível de logging correspondente a cada nível aceito por log_enhanced
+_LEVEL_MAP = {
+    'info': logging.INFO,
+    'debug': logging.DEBUG,
+    'warning': logging.WARNING,
+    'error': logging.ERROR,
+    'critical': logging.CRITICAL,
+    'success': logging.INFO
+}
+
+# Disponibilidade do logger avançado, verificada uma vez; a função setup do
+# módulo é importada no primeiro setup_logging(use_enhanced=True)
+try:
+    _HAS_ENHANCED = importlib.util.find_spec('services.enhanced_logging_service') is not None
+except ModuleNotFoundError:
+    _HAS_ENHANCED = False
+_enhanced_setup = None
+
+# Tipos de processo conhecidos, internados: nomes montados em tempo de execução
+# (lidos da configuração, por exemplo) passam a ser o mesmo objeto dos literais
+_PROCESS_TYPES = {n: sys.intern(n) for n in ('ui', 'core', 'system', 'speech', 'input')}
+
+# Logger raiz (singleton do módulo logging), usado para filtrar níveis nos atalhos
+_ROOT = logging.getLogger()
+
+# Métodos log_<nível> do logger avançado, por nível (None sem logger avançado)
+_enhanced_dispatch = None
+
+def _current_log_file():
+    """Retorna o caminho do arquivo de log do dia atual (nome baseado na data)."""
+    return LOG_DIR / f"ubuntu-dictation-{time.strftime('%Y-%m-%d')}.log"
+
+
+class FastFormatter(logging.Formatter):
+    """
+    Formatter que reaproveita a parte "YYYY-MM-DD HH:MM:" do timestamp.
+    
+    O prefixo é calculado (localtime + strftime) uma vez por minuto e guardado
+    por thread; nos demais registros só os segundos são formatados. Outros
+    formatos de data seguem o caminho normal do logging.Formatter.
+    """
+    
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._tls = threading.local()
+    
+    def formatTime(self, record, datefmt=None):
+        if datefmt != LOG_DATEFMT:
+            return super().formatTime(record, datefmt)
+        
+        ts = int(record.created)
+        sec = ts % 60
+        minute = ts - sec
+        tls = self._tls
+        if getattr(tls, 'minute', None) != minute:
+            tls.prefix = time.strftime('%Y-%m-%d %H:%M:', self.converter(minute))
+            tls.minute = minute
+        return f"{tls.prefix}{sec:02d}"
+
+
+class FixedFormatter(FastFormatter):
+    """
+    Formatter do formato fixo LOG_FORMAT, montado com uma f-string.
+    
+    Produz o mesmo texto que logging.Formatter(LOG_FORMAT), sem passar pelo
+    formatador genérico de % sobre o dicionário do registro. Registros do
+    EnhancedLogger (com o extra function_name) saem como "função: mensagem",
+    igual ao caminho sem o logger avançado.
+    """
+    
+    def __init__(self, datefmt=LOG_DATEFMT):
+        super().__init__(LOG_FORMAT, datefmt=datefmt)
+    
+    def format(self, record):
+        record.message = record.getMessage()
+        record.asctime = self.formatTime(record, self.datefmt)
+        function_name = record.__dict__.get('function_name')
+        if function_name:
+            s = f"{record.asctime} - {record.name} - {record.levelname} - {function_name}: {record.message}"
+        else:
+            s = f"{record.asctime} - {record.name} - {record.levelname} - {record.message}"
+        
+        if record.exc_info and not record.exc_text:
+            record.exc_text = self.formatException(record.exc_info)
+        if record.exc_text:
+            if s[-1:] != "\n":
+                s += "\n"
+            s += record.exc_text
+        if record.stack_info:
+            if s[-1:] != "\n":
+                s += "\n"
+            s += self.formatStack(record.stack_info)
+        return s
+
+
+class BufferedRotatingFileHandler(RotatingFileHandler):
+    """
+    RotatingFileHandler que acumula as escritas num buffer de 64 KiB.
+    
+    O buffer é descarregado imediatamente para registros de ERROR ou acima,
+    periodicamente (a cada flush_interval segundos) e ao fechar o handler,
+    em vez de uma chamada write() ao sistema por linha de log.
+    
+    O tamanho do arquivo é acompanhado por um contador (_bytes_written), de modo
+    que a verificação de rotação só consulta o arquivo perto de maxBytes; o
+    seek/tell do RotatingFileHandler descarregaria o buffer a cada registro.
+    """
+    
+    def __init__(self, *args, flush_interval=FLUSH_INTERVAL, **kwargs):
+        self._bytes_written = 0
+        super().__init__(*args, **kwargs)
+        self._flush_stop = threading.Event()
+        self._flusher = threading.Thread(
+            target=self._flush_loop, args=(flush_interval,),
+            name="LogFileFlusher", daemon=True
+        )
+        self._flusher.start()
+    
+    def _open(self):
+        """Abre o arquivo com um buffer grande (TextIOWrapper sobre BufferedWriter)."""
+        stream = open(self.baseFilename, self.mode, buffering=FILE_BUFFER_SIZE,
+                      encoding=self.encoding, errors=self.errors)
+        self._bytes_written = os.fstat(stream.fileno()).st_size
+        return stream
+    
+    def emit(self, record):
+        """Grava o registro, descarregando o buffer só para erros."""
+        try:
+            if self.stream is None:
+                self.stream = self._open()
+            msg = self.format(record) + self.terminator
+            if self.maxBytes > 0 and self._bytes_written + len(msg) >= self.maxBytes:
+                # Perto do limite: confirma pelo arquivo (que pode ter sido
+                # truncado ou não ser um arquivo regular) antes de rotacionar
+                if self.shouldRollover(record):
+                    self.doRollover()
+                    if self.stream is None:
+                        self.stream = self._open()
+                else:
+                    self._bytes_written = self.stream.tell()
+            self.stream.write(msg)
+            self._bytes_written += len(msg)
+            if record.levelno >= logging.ERROR:
+                self.flush()
+        except RecursionError:
+            raise
+        except Exception:
+            self.handleError(record)
+    
+    def _flush_loop(self, interval):
+        """Descarrega o buffer periodicamente até o handler ser fechado."""
+        while not self._flush_stop.wait(interval):
+            self.flush()
+    
+    def close(self):
+        """Para a descarga periódica e fecha o arquivo (descarregando o buffer)."""
+        self._flush_stop.set()
+        super().close()
+
+
+class RingHandler(logging.Handler):
+    """
+    Handler que guarda em memória as últimas linhas de log formatadas.
+    
+    Permite mostrar os registros recentes (por exemplo, na interface) sem ler
+    o arquivo de log; as linhas mais antigas são descartadas ao passar de capacity.
+    """
+    
+    def __init__(self, capacity=2000):
+        super().__init__()
+        self.buf = deque(maxlen=capacity)
+    
+    def emit(self, record):
+        try:
+            self.buf.append(self.format(record))
+        except RecursionError:
+            raise
+        except Exception:
+            self.handleError(record)
+
+
+# Últimos registros do processo, mantidos entre reconfigurações do logging
+_ring_handler = RingHandler()
+
+# Thread que grava os registros enfileirados nos handlers de console e arquivo
+_log_listener = None
+
+
+def _shutdown_logging():
+    """
+    Para a thread de gravação e fecha seus handlers de forma durável.
+    
+    Os registros ainda na fila são gravados, os buffers descarregados e os
+    arquivos de log sincronizados com o disco (fsync) antes de serem fechados.
+    Pode ser chamada mais de uma vez.
+    """
+    global _log_listener
+    if _log_listener is None:
+        return
+    
+    listener, _log_listener = _log_listener, None
+    
+    # Tira do logger raiz o QueueHandler desta fila antes de parar a thread: sem
+    # ele, registros posteriores (threads, outros handlers de atexit) caem no
+    # logging.lastResort em vez de sumirem numa fila que ninguém mais lê
+    root = logging.getLogger()
+    for handler in root.handlers[:]:
+        if isinstance(handler, QueueHandler) and handler.queue is listener.queue:
+            root.removeHandler(handler)
+    listener.stop()
+    for handler in listener.handlers:
+        handler.flush()
+        if isinstance(handler, logging.FileHandler) and handler.stream is not None:
+            try:
+                os.fsync(handler.stream.fileno())
+            except (OSError, ValueError):
+                pass
+            handler.close()
+
+
+atexit.register(_shutdown_logging)
+
+
+def _handle_sigterm(signum, frame):
+    """Encerra o processo ao receber SIGTERM, gravando os logs pendentes na saída."""
+    # Só levanta SystemExit: chamar _shutdown_logging aqui poderia travar se o
+    # sinal interrompesse um Queue.put (que segura o mesmo lock da fila) e
+    # perderia o que for registrado enquanto a pilha é desfeita. O atexit chama
+    # _shutdown_logging depois, assim como os demais handlers (como a gravação
+    # das configurações)
+    raise SystemExit(128 + signum)
+
+
+def _install_sigterm_handler():
+    """Instala _handle_sigterm se o SIGTERM ainda tiver o comportamento padrão."""
+    # signal.signal só pode ser chamado na thread principal
+    if threading.current_thread() is not threading.main_thread():
+        return
+    if signal.getsignal(signal.SIGTERM) is signal.SIG_DFL:
+        signal.signal(signal.SIGTERM, _handle_sigterm)
+
 def setup_logging(level=None, log_to_console=True, log_to_file=True, use_enhanced=False):
     """
     Configura o sistema de logging da aplicação.
@@ -47,7 +302,7 @@ def setup_logging(level=None, log_to_console=True, log_to_file=True, use_enhance
     Returns:
         O logger configurado
     """
-    global enhanced_logger
+    global enhanced_logger, _enhanced_dispatch, _enhanced_setup, _log_listener, _log_dir_ready
     
     # Definir nível de logging
     log_level = level or DEFAULT_LOG_LEVEL
@@ -56,49 +311,86 @@ def setup_logging(level=None, log_to_console=True, log_to_file=True, use_enhance
     logger = logging.getLogger()
     logger.setLevel(log_level)
     
-    # Limpar handlers existentes (caso a função seja chamada múltiplas vezes)
+    # Limpar handlers existentes (caso a função seja chamada múltiplas vezes).
+    # O EnhancedLogger ativo também é um handler do logger raiz e continua
+    # anexado; com use_enhanced=True, setup() o fecha e o substitui
+    enhanced_module = sys.modules.get('services.enhanced_logging_service')
+    active_enhanced = getattr(enhanced_module, '_logger', None)
     for handler in logger.handlers[:]:
-        logger.removeHandler(handler)
+        if handler is not active_enhanced:
+            logger.removeHandler(handler)
+    _shutdown_logging()
     
     # Criar formatador
-    formatter = logging.Formatter(
-        '%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-        datefmt='%Y-%m-%d %H:%M:%S'
-    )
+    formatter = FixedFormatter()
+    
+    # Arquivo do dia em que o logging é configurado
+    log_file = _current_log_file()
+    
+    # Os handlers de console, arquivo e memória não ficam no logger raiz: quem
+    # registra só enfileira o LogRecord, e uma thread (QueueListener) faz a gravação
+    _ring_handler.setFormatter(formatter)
+    handlers = [_ring_handler]
+    file_error = None
     
     # Adicionar handler de console se solicitado
     if log_to_console:
         console_handler = logging.StreamHandler()
         console_handler.setFormatter(formatter)
-        logger.addHandler(console_handler)
+        handlers.append(console_handler)
     
     # Adicionar handler de arquivo se solicitado
     if log_to_file:
         try:
-            file_handler = RotatingFileHandler(
-                LOG_FILE,
+            # Garantir que o diretório de logs exista
+            if not _log_dir_ready:
+                LOG_DIR.mkdir(parents=True, exist_ok=True)
+                _log_dir_ready = True
+            file_handler = BufferedRotatingFileHandler(
+                log_file,
                 maxBytes=MAX_LOG_SIZE,
-                backupCount=BACKUP_COUNT
+                backupCount=BACKUP_COUNT,
+                encoding='utf-8'
             )
             file_handler.setFormatter(formatter)
-            logger.addHandler(file_handler)
+            handlers.append(file_handler)
         except (PermissionError, OSError) as e:
-            # Se não puder criar o arquivo de log, pelo menos avisar no console
-            logging.error(f"Não foi possível configurar o log em arquivo: {e}")
+            file_error = e
+    
+    log_queue = queue.Queue(-1)
+    logger.addHandler(QueueHandler(log_queue))
+    _log_listener = QueueListener(log_queue, *handlers, respect_handler_level=True)
+    _log_listener.start()
+    _install_sigterm_handler()
+    
+    if file_error is not None:
+        # Se não puder criar o arquivo de log, pelo menos avisar no console
+        logging.error("Não foi possível configurar o log em arquivo: %s", file_error)
     
     # Log inicial para confirmar configuração
-    logger.info(f"Logging iniciado: nível={logging.getLevelName(log_level)}, "
-               f"arquivo={LOG_FILE if log_to_file else 'Desativado'}")
+    logger.info("Logging iniciado: nível=%s, arquivo=%s",
+                logging.getLevelName(log_level), log_file if log_to_file else 'Desativado')
     
     # Inicializar logger avançado se solicitado
     if use_enhanced:
-        try:
-            # Importação adiada para evitar ciclos de importação
-            from services.enhanced_logging_service import setup
-            enhanced_logger = setup(APP_NAME)
+        if _enhanced_setup is None and _HAS_ENHANCED:
+            try:
+                # Importação adiada para evitar ciclos de importação
+                from services.enhanced_logging_service import setup as _enhanced_setup
+            except ImportError as e:
+                logger.warning("Não foi possível inicializar o enhanced logger: %s", e)
+        
+        if _enhanced_setup is not None:
+            enhanced_logger = _enhanced_setup(APP_NAME)
+            # log_debug fica de fora: set_debug_mode o troca na instância por
+            # um no-op, então ele é resolvido a cada chamada em log_enhanced
+            _enhanced_dispatch = {
+                lvl: getattr(enhanced_logger, f"log_{lvl}", enhanced_logger.log_info)
+                for lvl in _LEVEL_MAP if lvl != 'debug'
+            }
             logger.info("Enhanced logging ativado")
-        except ImportError as e:
-            logger.warning(f"Não foi possível inicializar o enhanced logger: {e}")
+        elif not _HAS_ENHANCED:
+            logger.warning("Não foi possível inicializar o enhanced logger: módulo não encontrado")
     
     return logger
 
@@ -116,10 +408,29 @@ def get_logger(name):
     return logging.getLogger(name)
 
 
+def recent_logs(n=200):
+    """
+    Retorna as últimas linhas de log registradas neste processo.
+    
+    Args:
+        n: Número máximo de linhas a retornar
+    
+    Returns:
+        Lista de linhas formatadas, da mais antiga à mais recente
+    """
+    if n <= 0:
+        return []
+    return list(_ring_handler.buf)[-n:]
+
+
 class LogCapture:
     """
     Captura saídas de stdout/stderr e as redireciona para o logging.
     Útil para capturar saídas de bibliotecas de terceiros.
+    
+    Além de substituir sys.stdout/sys.stderr, redireciona os descritores 1 e 2
+    para um pipe lido por uma thread, capturando também o que extensões em C
+    (vosk, portaudio) escrevem direto nos descritores.
     """
     
     def __init__(self, logger=None, level=logging.INFO):
@@ -134,27 +445,191 @@ class LogCapture:
         self.level = level
         self.stdout_original = sys.stdout
         self.stderr_original = sys.stderr
+        # Trecho final ainda sem quebra de linha (print escreve o texto e o "\n" separados)
+        self._buf = []
+        # Estado da captura por descritor (None quando inativa)
+        self._saved_fds = None
+        self._reader = None
+        self._retargeted = []
     
     def __enter__(self):
         """Ativa a captura ao entrar no contexto."""
+        self._start_fd_capture()
         sys.stdout = self
         sys.stderr = self
         return self
     
     def __exit__(self, exc_type, exc_val, exc_tb):
         """Restaura saídas originais ao sair do contexto."""
+        self.flush()
         sys.stdout = self.stdout_original
         sys.stderr = self.stderr_original
+        self._stop_fd_capture()
+    
+    def _start_fd_capture(self):
+        """Redireciona os descritores 1 e 2 para um pipe drenado por uma thread."""
+        for stream in (sys.stdout, sys.stderr):
+            if stream is not None:
+                stream.flush()
+        try:
+            saved_out = os.dup(1)
+        except OSError:
+            # Processo sem stdout/stderr no nível do sistema: só a captura Python
+            return
+        try:
+            saved_err = os.dup(2)
+        except OSError:
+            os.close(saved_out)
+            return
+        read_fd, write_fd = os.pipe()
+        
+        # Handlers de console passam a escrever no terminal original; senão o que
+        # gravam voltaria pelo pipe e seria capturado de novo, em laço
+        saved = {1: saved_out, 2: saved_err}
+        for handler, fd in self._console_handlers():
+            replacement = open(os.dup(saved[fd]), 'w', buffering=1,
+                               encoding=getattr(handler.stream, 'encoding', None) or 'utf-8',
+                               errors='backslashreplace')
+            self._retargeted.append((handler, handler.setStream(replacement), replacement))
+        
+        os.dup2(write_fd, 1)
+        os.dup2(write_fd, 2)
+        # As cópias em 1 e 2 mantêm o pipe aberto até serem restauradas
+        os.close(write_fd)
+        
+        self._saved_fds = (saved_out, saved_err)
+        self._reader = threading.Thread(
+            target=self._drain, args=(read_fd,), name="LogCaptureReader", daemon=True
+        )
+        self._reader.start()
+    
+    def _stop_fd_capture(self):
+        """Restaura os descritores 1 e 2 e espera a thread drenar o pipe."""
+        if self._saved_fds is None:
+            return
+        saved_out, saved_err = self._saved_fds
+        self._saved_fds = None
+        
+        # Restaurar 1 e 2 fecha as últimas pontas de escrita: a thread lê o
+        # restante do pipe, recebe EOF e termina
+        os.dup2(saved_out, 1)
+        os.dup2(saved_err, 2)
+        os.close(saved_out)
+        os.close(saved_err)
+        self._reader.join(timeout=1.0)
+        self._reader = None
+        
+        for handler, original, replacement in self._retargeted:
+            handler.setStream(original)
+            replacement.close()
+        self._retargeted = []
+    
+    def _console_handlers(self):
+        """Retorna os StreamHandlers (exceto arquivos) que escrevem nos descritores 1 ou 2."""
+        handlers = list(logging.getLogger().handlers)
+        if _log_listener is not None:
+            handlers.extend(_log_listener.handlers)
+        
+        result = []
+        for handler in handlers:
+            if not isinstance(handler, logging.StreamHandler) or isinstance(handler, logging.FileHandler):
+                continue
+            try:
+                fd = handler.stream.fileno()
+            except (AttributeError, OSError, ValueError):
+                continue
+            if fd in (1, 2):
+                result.append((handler, fd))
+        return result
+    
+    def _drain(self, read_fd):
+        """Lê o pipe em blocos e registra cada linha completa (executa na thread leitora)."""
+        decoder = codecs.getincrementaldecoder('utf-8')(errors='replace')
+        pending = ''
+        try:
+            while True:
+                chunk = os.read(read_fd, 65536)
+                if not chunk:
+                    break
+                data = pending + decoder.decode(chunk)
+                idx = data.rfind('\n')
+                if idx < 0:
+                    pending = data
+                    continue
+                pending = data[idx + 1:]
+                self._log_lines(data[:idx])
+            self._log_lines(pending + decoder.decode(b'', final=True))
+        finally:
+            os.close(read_fd)
     
     def write(self, message):
-        """Redireciona mensagens escritas para o logger."""
-        if message and not message.isspace():
-            for line in message.rstrip().splitlines():
-                self.logger.log(self.level, line)
+        """Redireciona mensagens escritas para o logger, uma entrada por linha completa."""
+        if not message:
+            return
+        self._buf.append(message)
+        if '\n' not in message:
+            return
+        
+        data = ''.join(self._buf)
+        self._buf.clear()
+        idx = data.rfind('\n')
+        rest = data[idx + 1:]
+        if rest:
+            self._buf.append(rest)
+        self._log_lines(data[:idx])
     
     def flush(self):
-        """Implementação de flush para compatibilidade."""
-        pass
+        """Registra o trecho pendente ainda sem quebra de linha."""
+        if self._buf:
+            data = ''.join(self._buf)
+            self._buf.clear()
+            self._log_lines(data)
+    
+    def _log_lines(self, data):
+        """Registra cada linha não vazia do texto."""
+        for line in data.split('\n'):
+            line = line.rstrip()
+            if line:
+                self.logger.log(self.level, line)
+
+
+def _scan_log_entries():
+    """
+    Lê o diretório de logs e retorna tuplas (mtime, caminho), do mais recente ao mais antigo.
+    """
+    # Uma única passagem com scandir: o tipo vem do próprio dirent e o stat
+    # de cada entrada é feito uma só vez (glob + getmtime faziam dois)
+    with os.scandir(LOG_DIR) as it:
+        entries = [
+            (e.stat().st_mtime, e.path) for e in it
+            if e.is_file(follow_symlinks=False)
+            and e.name.startswith("ubuntu-dictation-") and e.name.endswith(".log")
+        ]
+    entries.sort(reverse=True)
+    return entries
+
+
+def _list_log_entries():
+    """
+    Versão em cache de _scan_log_entries, para listagens.
+    
+    O resultado é reaproveitado enquanto o mtime do diretório de logs não mudar
+    (criar, renomear ou remover arquivos altera esse mtime). Escrever num arquivo
+    não altera esse mtime, então os mtimes por arquivo do cache podem estar
+    desatualizados: não usar para decidir o que remover.
+    """
+    global _log_list_cache, _log_list_mtime
+    
+    try:
+        mtime = LOG_DIR.stat().st_mtime_ns
+    except FileNotFoundError:
+        return []
+    
+    if mtime != _log_list_mtime or _log_list_cache is None:
+        _log_list_cache = _scan_log_entries()
+        _log_list_mtime = mtime
+    
+    return _log_list_cache
 
 
 def list_log_files():
@@ -164,14 +639,7 @@ def list_log_files():
     Returns:
         Lista de caminhos para arquivos de log
     """
-    if not LOG_DIR.exists():
-        return []
-    
-    return sorted(
-        [f for f in LOG_DIR.glob("ubuntu-dictation-*.log")],
-        key=os.path.getmtime,
-        reverse=True
-    )
+    return [Path(p) for _, p in _list_log_entries()]
 
 
 def purge_old_logs(max_age_days=30, max_files=20):
@@ -185,23 +653,32 @@ def purge_old_logs(max_age_days=30, max_files=20):
     Returns:
         Número de arquivos removidos
     """
-    log_files = list_log_files()
+    global _log_list_mtime
     
-    # Se não exceder limites, não fazer nada
-    if len(log_files) <= max_files:
-        return 0
+    cutoff = time.time() - max_age_days * 86400
     
-    # Manter max_files mais recentes, remover o resto
-    files_to_remove = log_files[max_files:]
+    # Leitura nova do diretório (sem o cache): os mtimes precisam ser os atuais,
+    # senão um log ainda em uso poderia parecer antigo e ser removido
+    try:
+        entries = _scan_log_entries()
+    except FileNotFoundError:
+        return 0
     
-    # Tentativa de remoção
+    # Manter os max_files mais recentes que não passaram da idade máxima
     removed = 0
-    for file_path in files_to_remove:
+    for index, (mtime, path) in enumerate(entries):
+        if index < max_files and mtime >= cutoff:
+            continue
         try:
-            file_path.unlink()
+            os.unlink(path)
             removed += 1
-        except (PermissionError, OSError) as e:
-            logging.warning(f"Não foi possível remover log antigo {file_path}: {e}")
+        except OSError as e:
+            logging.warning("Não foi possível remover log antigo %s: %s", path, e)
+    
+    # Força uma nova listagem (o mtime do diretório pode não mudar dentro da
+    # resolução do sistema de arquivos)
+    if removed:
+        _log_list_mtime = -1
     
     return removed
 
@@ -220,49 +697,58 @@ def log_enhanced(function_name, message, level="info", process_type="system"):
     Returns:
         True se o log foi registrado, False se o logger avançado não está disponível
     """
-    if enhanced_logger is None:
-        # Log normal se o enhanced logger não estiver ativo
-        logging.getLogger().log(
-            logging.INFO if level == "success" else getattr(logging, level.upper(), logging.INFO),
-            f"{function_name}: {message}"
-        )
+    dispatch = _enhanced_dispatch
+    if dispatch is None:
+        # Log normal se o enhanced logger não estiver ativo (_log pula a
+        # verificação de nível repetida em Logger.log, já feita aqui)
+        lvl = _LEVEL_MAP.get(level, logging.INFO)
+        if _ROOT.isEnabledFor(lvl):
+            _ROOT._log(lvl, "%s: %s", (function_name, message))
         return False
-        
-    # Chama o método correto baseado no nível
-    method_name = f"log_{level}"
-    if hasattr(enhanced_logger, method_name):
-        method = getattr(enhanced_logger, method_name)
-        method(function_name, message, process_type)
-        return True
-    
-    # Fallback para log_info se o método não existir
-    enhanced_logger.log_info(function_name, message, process_type)
+    
+    # Chama o método correto baseado no nível (log_info para níveis desconhecidos)
+    method = dispatch.get(level)
+    if method is None:
+        method = enhanced_logger.log_debug if level == 'debug' else dispatch['info']
+    method(function_name, message, _PROCESS_TYPES.get(process_type, process_type))
     return True
 
 
 # Funções de conveniência para o logger avançado
 def info(function_name, message, process_type="system"):
     """Registra mensagem informativa no logger avançado"""
+    if not _ROOT.isEnabledFor(logging.INFO):
+        return False
     return log_enhanced(function_name, message, "info", process_type)
 
 def debug(function_name, message, process_type="system"):
     """Registra mensagem de depuração no logger avançado"""
+    if not _ROOT.isEnabledFor(logging.DEBUG):
+        return False
     return log_enhanced(function_name, message, "debug", process_type)
 
 def success(function_name, message, process_type="system"):
     """Registra mensagem de sucesso no logger avançado"""
+    if not _ROOT.isEnabledFor(logging.INFO):
+        return False
     return log_enhanced(function_name, message, "success", process_type)
 
 def warning(function_name, message, process_type="system"):
     """Registra mensagem de aviso no logger avançado"""
+    if not _ROOT.isEnabledFor(logging.WARNING):
+        return False
     return log_enhanced(function_name, message, "warning", process_type)
 
 def error(function_name, message, process_type="system"):
     """Registra mensagem de erro no logger avançado"""
+    if not _ROOT.isEnabledFor(logging.ERROR):
+        return False
     return log_enhanced(function_name, message, "error", process_type)
 
 def critical(function_name, message, process_type="system"):
     """Registra mensagem de erro crítico no logger avançado"""
+    if not _ROOT.isEnabledFor(logging.CRITICAL):
+        return False
     return log_enhanced(function_name, message, "critical", process_type)
 
 
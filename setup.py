@@ -5,6 +5,7 @@ reconhecimento de voz para Ubuntu, similar ao recurso de ditado do Windows 11 (W
 """
 import os
 import sys
+from pathlib import Path
 
 # Definição da estrutura do projeto
 PROJECT_NAME = "ubuntu_dictation"
@@ -67,46 +68,61 @@ PROJECT_STRUCTURE = {
     ]
 }
 
-def create_directories_and_files(base_path, structure):
+def _flatten(structure, base, out_dirs, out_files):
     """
-    Cria recursivamente os diretórios e arquivos com base na estrutura definida.
+    Percorre a estrutura uma única vez, acumulando os caminhos a criar.
     
     Args:
-        base_path: Caminho base onde criar a estrutura
         structure: Dicionário ou lista definindo a estrutura
+        base: Caminho base da estrutura
+        out_dirs: Conjunto que recebe os diretórios
+        out_files: Lista que recebe os arquivos
     """
     if isinstance(structure, dict):
         for directory, contents in structure.items():
-            dir_path = os.path.join(base_path, directory)
-            
-            # Criar diretório se não existir
-            if not os.path.exists(dir_path):
-                os.makedirs(dir_path)
-                print(f"Criado diretório: {dir_path}")
-            
-            # Processar conteúdo do diretório
-            create_directories_and_files(dir_path, contents)
+            dir_path = os.path.join(base, directory)
+            out_dirs.add(dir_path)
+            _flatten(contents, dir_path, out_dirs, out_files)
             
     elif isinstance(structure, list):
         for item in structure:
             if isinstance(item, dict):
                 # Se for dicionário, é um subdiretório
-                create_directories_and_files(base_path, item)
+                _flatten(item, base, out_dirs, out_files)
             else:
-                # Se for string, é um arquivo
-                file_path = os.path.join(base_path, item)
-                
-                # Verificar se o caminho contém um subdiretório
-                file_dir = os.path.dirname(file_path)
-                if file_dir and not os.path.exists(file_dir):
-                    os.makedirs(file_dir)
-                    print(f"Criado diretório: {file_dir}")
-                
-                # Criar arquivo vazio se não existir
-                if not os.path.exists(file_path):
-                    with open(file_path, 'w') as f:
-                        pass  # Arquivo vazio
-                    print(f"Criado arquivo: {file_path}")
+                # Se for string, é um arquivo (possivelmente dentro de um subdiretório)
+                file_path = os.path.join(base, item)
+                out_dirs.add(os.path.dirname(file_path))
+                out_files.append(file_path)
+
+
+def create_directories_and_files(base_path, structure):
+    """
+    Cria os diretórios e arquivos com base na estrutura definida.
+    
+    Args:
+        base_path: Caminho base onde criar a estrutura
+        structure: Dicionário ou lista definindo a estrutura
+    """
+    dirs = set()
+    files = []
+    _flatten(structure, base_path, dirs, files)
+    
+    # Em ordem, cada diretório pai é criado antes dos seus subdiretórios; mkdir e
+    # touch falham se o caminho já existir, dispensando um os.path.exists antes
+    for dir_path in sorted(dirs):
+        try:
+            Path(dir_path).mkdir(parents=True)
+            print(f"Criado diretório: {dir_path}")
+        except FileExistsError:
+            pass
+    
+    for file_path in files:
+        try:
+            Path(file_path).touch(exist_ok=False)  # Arquivo vazio
+            print(f"Criado arquivo: {file_path}")
+        except FileExistsError:
+            pass
 
 
 def main():